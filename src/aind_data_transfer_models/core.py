@@ -5,9 +5,10 @@ import logging
 import re
 from contextlib import contextmanager
 from contextvars import ContextVar
-from copy import deepcopy
-from datetime import datetime
+from datetime import datetime, tzinfo
+from functools import cache, lru_cache
 from pathlib import PurePosixPath
+from string import ascii_lowercase, ascii_uppercase
 from typing import (
     Any,
     ClassVar,
@@ -44,6 +45,7 @@ from aind_slurm_rest import V0036JobProperties
 from codeocean.computation import DataAssetsRunParam, RunParams
 from codeocean.data_asset import AWSS3Source, DataAssetParams, Source
 from pydantic import (
+    BaseModel,
     ConfigDict,
     EmailStr,
     Field,
@@ -52,7 +54,6 @@ from pydantic import (
     field_validator,
     model_validator,
 )
-from pydantic_settings import BaseSettings
 
 from aind_data_transfer_models.s3_upload_configs import (
     BucketType,
@@ -61,11 +62,66 @@ from aind_data_transfer_models.s3_upload_configs import (
 )
 from aind_data_transfer_models.trigger import TriggerConfigModel, ValidJobType
 
+logger = logging.getLogger(__name__)
+
+# Upper-cases and maps "-" to "_" in a single pass for modality lookups
+_MODALITY_KEY_TABLE = str.maketrans(
+    "-" + ascii_lowercase, "_" + ascii_uppercase
+)
+
 _validation_context: ContextVar[Union[Dict[str, Any], None]] = ContextVar(
     "_validation_context", default=None
 )
 
 
+@cache
+def _session_job_settings_by_name() -> Dict[str, type]:
+    """
+    Maps each job_settings_name accepted by SessionSettings to its job
+    settings class. Computed on first use and cached afterwards.
+    Returns
+    -------
+    Dict[str, type]
+
+    """
+    return {
+        f.model_fields["job_settings_name"].default: f
+        for f in get_args(
+            SessionSettings.model_fields["job_settings"].annotation
+        )
+    }
+
+
+@lru_cache(maxsize=1024)
+def _build_s3_prefix(
+    platform_abbreviation: str,
+    subject_id: str,
+    acq_datetime: datetime,
+    tzinfo: Optional[tzinfo],
+) -> str:
+    """
+    Builds the s3_prefix of an upload job. The validators and every
+    serialization read s3_prefix, so results are cached by their inputs.
+    Parameters
+    ----------
+    platform_abbreviation : str
+    subject_id : str
+    acq_datetime : datetime
+    tzinfo : Optional[tzinfo]
+      The tzinfo of acq_datetime. Aware datetimes at the same instant are
+      equal, so it's part of the key to keep their local times apart.
+
+    Returns
+    -------
+    str
+
+    """
+    return build_data_name(
+        label=f"{platform_abbreviation}_{subject_id}",
+        creation_datetime=acq_datetime,
+    )
+
+
 @contextmanager
 def validation_context(context: Union[Dict[str, Any], None]) -> None:
     """
@@ -87,16 +143,16 @@ def validation_context(context: Union[Dict[str, Any], None]) -> None:
         _validation_context.reset(token)
 
 
-class ModalityConfigs(BaseSettings):
+class ModalityConfigs(BaseModel):
     """Class to contain configs for each modality type"""
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", validate_default=True)
 
     # Need some way to extract abbreviations. Maybe a public method can be
     # added to the Modality class
     _MODALITY_MAP: ClassVar = {
-        m().abbreviation.upper().replace("-", "_"): m().abbreviation
-        for m in Modality.ALL
+        m.abbreviation.translate(_MODALITY_KEY_TABLE): m
+        for m in (m_cls() for m_cls in Modality.ALL)
     }
 
     modality: Modality.ONE_OF = Field(
@@ -150,12 +206,12 @@ class ModalityConfigs(BaseSettings):
         """Attempts to convert strings to a Modality model. Raises an error
         if unable to do so."""
         if isinstance(input_modality, str):
-            modality_abbreviation = cls._MODALITY_MAP.get(
-                input_modality.upper().replace("-", "_")
+            modality = cls._MODALITY_MAP.get(
+                input_modality.translate(_MODALITY_KEY_TABLE)
             )
-            if modality_abbreviation is None:
+            if modality is None:
                 raise AttributeError(f"Unknown Modality: {input_modality}")
-            return Modality.from_abbreviation(modality_abbreviation)
+            return modality
         else:
             return input_modality
 
@@ -210,7 +266,7 @@ class ModalityConfigs(BaseSettings):
         return self
 
 
-class CodeOceanPipelineMonitorConfigs(BaseSettings):
+class CodeOceanPipelineMonitorConfigs(BaseModel):
     """
     Configs for handling registering data to Code Ocean and requesting
     Code Ocean pipelines to run on the newly registered data. The transfer
@@ -218,7 +274,7 @@ class CodeOceanPipelineMonitorConfigs(BaseSettings):
     they wish.
     """
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", validate_default=True)
 
     capture_results_to_default_bucket: bool = Field(
         default=True,
@@ -257,7 +313,7 @@ class CodeOceanPipelineMonitorConfigs(BaseSettings):
             "use any defaults. A max of 5 pipelines can be requested. Please "
             "talk to an admin if more are needed."
         ),
-        max_items=5,
+        max_length=5,
     )
     register_data_settings: DataAssetParams = Field(
         default=DataAssetParams(
@@ -283,7 +339,7 @@ class CodeOceanPipelineMonitorConfigs(BaseSettings):
         return v
 
 
-class BasicUploadJobConfigs(BaseSettings):
+class BasicUploadJobConfigs(BaseModel):
     """Configuration for the basic upload job"""
 
     # noinspection PyMissingConstructor
@@ -295,19 +351,27 @@ class BasicUploadJobConfigs(BaseSettings):
             context=_validation_context.get(),
         )
 
-    model_config = ConfigDict(use_enum_values=True, extra="allow")
+    model_config = ConfigDict(
+        use_enum_values=True,
+        extra="allow",
+        revalidate_instances="never",
+        validate_default=True,
+    )
 
     # Need some way to extract abbreviations. Maybe a public method can be
     # added to the Platform class
     _PLATFORM_MAP: ClassVar = {
-        p().abbreviation.upper(): p().abbreviation for p in Platform.ALL
+        p.abbreviation.upper(): p for p in (p_cls() for p_cls in Platform.ALL)
     }
-    _DATETIME_PATTERN1: ClassVar = re.compile(
-        r"^\d{4}-\d{2}-\d{2}[ |T]\d{2}:\d{2}:\d{2}$"
-    )
-    _DATETIME_PATTERN2: ClassVar = re.compile(
+    _US_DATETIME_PATTERN: ClassVar = re.compile(
         r"^\d{1,2}/\d{1,2}/\d{4} \d{1,2}:\d{2}:\d{2} [APap][Mm]$"
     )
+    _PLATFORM_JOB_TYPE_MAP: ClassVar = {
+        Platform.ECEPHYS: ValidJobType.ECEPHYS,
+        Platform.SMARTSPIM: ValidJobType.SMARTSPIM,
+        Platform.SINGLE_PLANE_OPHYS: ValidJobType.SINGLEPLANE_OPHYS,
+        Platform.MULTIPLANE_OPHYS: ValidJobType.MULTIPLANE_OPHYS,
+    }
 
     user_email: Optional[EmailStr] = Field(
         default=None,
@@ -354,7 +418,7 @@ class BasicUploadJobConfigs(BaseSettings):
         ...,
         description="Data collection modalities and their directory location",
         title="Modalities",
-        min_items=1,
+        min_length=1,
     )
     subject_id: str = Field(..., description="Subject ID", title="Subject ID")
     acq_datetime: datetime = Field(
@@ -405,9 +469,11 @@ class BasicUploadJobConfigs(BaseSettings):
     @computed_field
     def s3_prefix(self) -> str:
         """Construct s3_prefix from configs."""
-        return build_data_name(
-            label=f"{self.platform.abbreviation}_{self.subject_id}",
-            creation_datetime=self.acq_datetime,
+        return _build_s3_prefix(
+            self.platform.abbreviation,
+            self.subject_id,
+            self.acq_datetime,
+            self.acq_datetime.tzinfo,
         )
 
     @model_validator(mode="before")
@@ -441,12 +507,12 @@ class BasicUploadJobConfigs(BaseSettings):
         """We're adding a policy that data uploaded through the service can
         only land in a handful of buckets. As default, things will be
         stored in the private bucket"""
-        if isinstance(bucket, str) and (BucketType.OPEN.value in bucket):
+        if isinstance(bucket, BucketType):
+            return bucket
+        elif isinstance(bucket, str) and (BucketType.OPEN.value in bucket):
             return BucketType.OPEN
         elif isinstance(bucket, str) and (BucketType.SCRATCH.value in bucket):
             return BucketType.SCRATCH
-        elif isinstance(bucket, BucketType):
-            return bucket
         else:
             return BucketType.PRIVATE
 
@@ -457,39 +523,43 @@ class BasicUploadJobConfigs(BaseSettings):
         """Attempts to convert strings to a Platform model. Raises an error
         if unable to do so."""
         if isinstance(input_platform, str):
-            platform_abbreviation = cls._PLATFORM_MAP.get(
-                input_platform.upper()
-            )
-            if platform_abbreviation is None:
+            platform = cls._PLATFORM_MAP.get(input_platform.upper())
+            if platform is None:
                 raise AttributeError(f"Unknown Platform: {input_platform}")
             else:
-                return Platform.from_abbreviation(platform_abbreviation)
+                return platform
         else:
             return input_platform
 
     @field_validator("acq_datetime", mode="before")
     def _parse_datetime(cls, datetime_val: Any) -> datetime:
         """Parses datetime string to %YYYY-%MM-%DD HH:mm:ss"""
-        is_str = isinstance(datetime_val, str)
-        if is_str and re.match(
-            BasicUploadJobConfigs._DATETIME_PATTERN1, datetime_val
-        ):
-            return datetime.fromisoformat(datetime_val)
-        elif is_str and re.match(
-            BasicUploadJobConfigs._DATETIME_PATTERN2, datetime_val
-        ):
-            return datetime.strptime(datetime_val, "%m/%d/%Y %I:%M:%S %p")
-        elif is_str:
-            raise ValueError(
-                "Incorrect datetime format, should be"
-                " YYYY-MM-DD HH:mm:ss or MM/DD/YYYY I:MM:SS P"
-            )
-        else:
+        if not isinstance(datetime_val, str):
             return datetime_val
+        # fromisoformat also accepts dates only, fractional seconds, time
+        # zones and other separators, so check the YYYY-MM-DD HH:mm:ss shape
+        # first. strptime is lenient about widths and spacing, so the other
+        # format is matched against a pattern.
+        try:
+            if (
+                len(datetime_val) == 19
+                and datetime_val[4] == datetime_val[7] == "-"
+                and datetime_val[10] in " T|"
+                and datetime_val[13] == datetime_val[16] == ":"
+            ):
+                return datetime.fromisoformat(datetime_val)
+            elif cls._US_DATETIME_PATTERN.match(datetime_val):
+                return datetime.strptime(datetime_val, "%m/%d/%Y %I:%M:%S %p")
+        except ValueError:
+            pass
+        raise ValueError(
+            "Incorrect datetime format, should be"
+            " YYYY-MM-DD HH:mm:ss or MM/DD/YYYY I:MM:SS P"
+        )
 
-    @staticmethod
+    @classmethod
     def _get_job_type(
-        platform: Platform, process_capsule_id: Optional[str] = None
+        cls, platform: Platform, process_capsule_id: Optional[str] = None
     ) -> ValidJobType:
         """
         Determines job type based on Platform
@@ -505,16 +575,9 @@ class BasicUploadJobConfigs(BaseSettings):
         """
         if process_capsule_id is not None:
             return ValidJobType.RUN_GENERIC_PIPELINE
-        if platform == Platform.ECEPHYS:
-            return ValidJobType.ECEPHYS
-        elif platform == Platform.SMARTSPIM:
-            return ValidJobType.SMARTSPIM
-        elif platform == Platform.SINGLE_PLANE_OPHYS:
-            return ValidJobType.SINGLEPLANE_OPHYS
-        elif platform == Platform.MULTIPLANE_OPHYS:
-            return ValidJobType.MULTIPLANE_OPHYS
-        else:
-            return ValidJobType.REGISTER_DATA
+        return cls._PLATFORM_JOB_TYPE_MAP.get(
+            platform, ValidJobType.REGISTER_DATA
+        )
 
     @model_validator(mode="after")
     def set_trigger_capsule_configs(self):
@@ -525,50 +588,55 @@ class BasicUploadJobConfigs(BaseSettings):
 
         """
         if (
-            self.trigger_capsule_configs is not None
-            and self.process_capsule_id is not None
+            self.process_capsule_id is not None
+            and self.trigger_capsule_configs is not None
             and self.trigger_capsule_configs.process_capsule_id
             != self.process_capsule_id
         ):
-            logging.warning(
+            logger.warning(
                 "Only one of trigger_capsule_configs or legacy "
                 "process_capsule_id should be set!"
             )
+        # Override these settings if the user supplied them.
+        s3_prefix = self.s3_prefix
+        overrides = {
+            "bucket": self.s3_bucket,
+            "prefix": s3_prefix,
+            "asset_name": s3_prefix,
+            "modalities": [m.modality for m in self.modalities],
+        }
         if self.trigger_capsule_configs is None:
-            default_trigger_capsule_configs = TriggerConfigModel(
+            # mount defaults to prefix in the TriggerConfigModel validator
+            self.trigger_capsule_configs = TriggerConfigModel(
                 job_type=self._get_job_type(
                     self.platform, self.process_capsule_id
                 ),
                 process_capsule_id=self.process_capsule_id,
                 input_data_mount=self.input_data_mount,
+                **overrides,
             )
         else:
-            default_trigger_capsule_configs = (
-                self.trigger_capsule_configs.model_copy(deep=True)
+            if self.trigger_capsule_configs.mount is None:
+                overrides["mount"] = s3_prefix
+            self.trigger_capsule_configs = (
+                self.trigger_capsule_configs.model_copy(update=overrides)
             )
-        # Override these settings if the user supplied them.
-        default_trigger_capsule_configs.bucket = self.s3_bucket
-        default_trigger_capsule_configs.prefix = self.s3_prefix
-        default_trigger_capsule_configs.asset_name = self.s3_prefix
-        if default_trigger_capsule_configs.mount is None:
-            default_trigger_capsule_configs.mount = self.s3_prefix
-        default_trigger_capsule_configs.modalities = [
-            m.modality for m in self.modalities
-        ]
-        self.trigger_capsule_configs = default_trigger_capsule_configs
         return self
 
     @model_validator(mode="wrap")
     def fill_in_metadata_configs(self, handler):
         """Fills in settings for gather metadata job"""
-        all_configs = deepcopy(self)
-        if isinstance(all_configs, BasicUploadJobConfigs):
-            all_configs = all_configs.model_dump(
+        if isinstance(self, BasicUploadJobConfigs):
+            all_configs = self.model_dump(
                 exclude={
                     "s3_prefix": True,
                     "modalities": {"__all__": {"output_folder_name"}},
                 }
             )
+        else:
+            # Only top-level keys are removed from the input, so a shallow
+            # copy is sufficient.
+            all_configs = dict(self)
         if all_configs.get("metadata_configs") is not None:
             if isinstance(
                 all_configs.get("metadata_configs"), GatherMetadataJobSettings
@@ -577,15 +645,15 @@ class BasicUploadJobConfigs(BaseSettings):
                     all_configs.get("metadata_configs").model_dump()
                 )
             else:
-                user_defined_metadata_configs: Dict[str, Any] = deepcopy(
+                user_defined_metadata_configs: Dict[str, Any] = dict(
                     all_configs.get("metadata_configs")
                 )
             del all_configs["metadata_configs"]
         else:
             user_defined_metadata_configs = dict()
         if user_defined_metadata_configs.get("session_settings") is not None:
-            user_defined_session_settings = deepcopy(
-                user_defined_metadata_configs.get("session_settings")
+            user_defined_session_settings = user_defined_metadata_configs.get(
+                "session_settings"
             )
             del user_defined_metadata_configs["session_settings"]
         else:
@@ -623,11 +691,6 @@ class BasicUploadJobConfigs(BaseSettings):
         # Override user defined values if they were set.
         user_defined_metadata_configs.update(default_metadata_configs)
 
-        # Validate metadata configs without session settings
-        validated_gather_configs = GatherMetadataJobSettings.model_validate(
-            user_defined_metadata_configs
-        )
-
         # Allow relaxed Session settings so that only job_settings_name and
         # user_settings_config_file need to be set
         if (
@@ -653,13 +716,14 @@ class BasicUploadJobConfigs(BaseSettings):
             and user_defined_session_settings["job_settings"][
                 "job_settings_name"
             ]
-            in [
-                f.model_fields["job_settings_name"].default
-                for f in get_args(
-                    SessionSettings.model_fields["job_settings"].annotation
-                )
-            ]
+            in _session_job_settings_by_name()
         ):
+            # Validate metadata configs without session settings
+            validated_gather_configs = (
+                GatherMetadataJobSettings.model_validate(
+                    user_defined_metadata_configs
+                )
+            )
             session_settings = SessionSettings.model_construct(
                 job_settings={
                     "user_settings_config_file": user_defined_session_settings[
@@ -671,20 +735,17 @@ class BasicUploadJobConfigs(BaseSettings):
                 }
             )
             validated_gather_configs.session_settings = session_settings
-            validated_self.metadata_configs = validated_gather_configs
         else:
             user_defined_metadata_configs["session_settings"] = (
                 user_defined_session_settings
             )
-            validated_self.metadata_configs = (
+            validated_gather_configs = (
                 GatherMetadataJobSettings.model_validate(
                     user_defined_metadata_configs
                 )
             )
-        validated_self.metadata_configs = (
-            validated_self.metadata_configs.model_copy(
-                update={"metadata_dir": metadata_dir}, deep=True
-            )
+        validated_self.metadata_configs = validated_gather_configs.model_copy(
+            update={"metadata_dir": metadata_dir}
         )
         return validated_self
 
@@ -706,18 +767,19 @@ class BasicUploadJobConfigs(BaseSettings):
         )
         co_custom_metadata.update(default_raw_custom_metadata)
         is_public = self.s3_bucket == BucketType.OPEN
+        s3_prefix = self.s3_prefix
         if self.codeocean_configs.register_data_settings.name == "":
-            name = self.s3_prefix
+            name = s3_prefix
         else:
             name = self.codeocean_configs.register_data_settings.name
         if self.codeocean_configs.register_data_settings.mount == "":
-            mount = self.s3_prefix
+            mount = s3_prefix
         else:
             mount = self.codeocean_configs.register_data_settings.mount
         source = Source(
             aws=AWSS3Source(
                 bucket=self.s3_bucket,  # Actual bucket is mapped by service
-                prefix=self.s3_prefix,
+                prefix=s3_prefix,
                 keep_on_external_storage=True,
                 public=is_public,
             )
@@ -816,6 +878,6 @@ class SubmitJobRequest(S3UploadSubmitJobRequest):
     upload_jobs: List[BasicUploadJobConfigs] = Field(
         ...,
         description="List of upload jobs to process. Max of 1000 at a time.",
-        min_items=1,
-        max_items=1000,
+        min_length=1,
+        max_length=1000,
     )
@@ -3,11 +3,17 @@ buckets."""
 
 from enum import Enum
 from pathlib import PurePosixPath
-from typing import List, Literal, Optional, Set
+from typing import Any, List, Literal, Optional, Set
 
 from aind_slurm_rest import V0036JobProperties
-from pydantic import EmailStr, Field, model_validator
-from pydantic_settings import BaseSettings
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    EmailStr,
+    Field,
+    field_validator,
+    model_validator,
+)
 
 
 class BucketType(str, Enum):
@@ -29,9 +35,11 @@ class EmailNotificationType(str, Enum):
     ALL = "all"
 
 
-class S3UploadJobConfigs(BaseSettings):
+class S3UploadJobConfigs(BaseModel):
     """Configs for uploading a local directory to S3."""
 
+    model_config = ConfigDict(extra="forbid", validate_default=True)
+
     user_email: Optional[EmailStr] = Field(
         default=None,
         description="User email address to send notifications to.",
@@ -75,10 +83,12 @@ class S3UploadJobConfigs(BaseSettings):
     )
 
 
-class S3UploadSubmitJobRequest(BaseSettings):
+class S3UploadSubmitJobRequest(BaseModel):
     """Main request that will be sent to the backend. Bundles jobs into a list
     and allows a user to add an email address to receive notifications."""
 
+    model_config = ConfigDict(extra="forbid", validate_default=True)
+
     job_type: Literal["s3_upload"] = "s3_upload"
     user_email: Optional[EmailStr] = Field(
         default=None,
@@ -95,10 +105,21 @@ class S3UploadSubmitJobRequest(BaseSettings):
     upload_jobs: List[S3UploadJobConfigs] = Field(
         ...,
         description="List of upload jobs to process. Max of 20 at a time.",
-        min_items=1,
-        max_items=100,
+        min_length=1,
+        max_length=100,
     )
 
+    @field_validator("upload_jobs", mode="before")
+    def copy_upload_jobs(cls, v: Any) -> Any:
+        """Copies jobs passed in as instances, so that propagating this
+        request's email settings doesn't modify the caller's jobs."""
+        if isinstance(v, list):
+            return [
+                j.model_copy() if isinstance(j, S3UploadJobConfigs) else j
+                for j in v
+            ]
+        return v
+
     @model_validator(mode="after")
     def propagate_email_settings(self):
         """Propagate email settings from global to individual jobs"""
@@ -155,40 +155,35 @@ class TriggerConfigModel(BaseSettings):
             self.process_capsule_id = self.capsule_id
 
         # input data asset ids, mounts, and names
+        input_data_asset_id = self.input_data_asset_id
+        input_data_mount = self.input_data_mount
+        if isinstance(input_data_asset_id, str) and ";" in input_data_asset_id:
+            input_data_asset_id = input_data_asset_id.split(";")
+            self.input_data_asset_id = input_data_asset_id
         if (
-            self.input_data_asset_id is not None
-            and isinstance(self.input_data_asset_id, str)
-            and ";" in self.input_data_asset_id
+            input_data_asset_id is not None
+            and isinstance(input_data_mount, str)
+            and ";" in input_data_mount
         ):
-            self.input_data_asset_id = self.input_data_asset_id.split(";")
-        if (
-            self.input_data_asset_id is not None
-            and self.input_data_mount is not None
-            and ";" in self.input_data_mount
-        ):
-            self.input_data_mount = self.input_data_mount.split(";")
-        if (
-            self.input_data_asset_id is not None
-            and isinstance(self.input_data_asset_id, list)
-            and not isinstance(self.input_data_mount, list)
+            input_data_mount = input_data_mount.split(";")
+            self.input_data_mount = input_data_mount
+        if isinstance(input_data_asset_id, list) and not isinstance(
+            input_data_mount, list
         ):
             raise ValueError(
                 "input_data_mount should be a list if "
                 "input_data_asset_id is a list."
             )
-        if (
-            self.input_data_asset_id is not None
-            and isinstance(self.input_data_asset_id, list)
-            and len(self.input_data_asset_id) != len(self.input_data_mount)
-        ):
+        if isinstance(input_data_asset_id, list) and len(
+            input_data_asset_id
+        ) != len(input_data_mount):
             raise ValueError(
                 "input_data_asset_id and input_data_mount should "
                 "have the same length when multiple input data "
                 "assets are attached."
             )
         if (
-            self.input_data_asset_id is not None
-            and isinstance(self.input_data_asset_id, list)
+            isinstance(input_data_asset_id, list)
             and self.input_data_asset_name is None
         ):
             raise ValueError(
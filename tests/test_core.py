@@ -2,9 +2,9 @@
 
 import json
 import unittest
-from datetime import datetime
-from pathlib import Path, PurePosixPath
-from unittest.mock import MagicMock, patch
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import MappingProxyType
 
 from aind_codeocean_pipeline_monitor.models import PipelineMonitorSettings
 from aind_data_schema_models.modalities import Modality
@@ -37,6 +37,23 @@ from aind_data_transfer_models.s3_upload_configs import (
 )
 from aind_data_transfer_models.trigger import TriggerConfigModel, ValidJobType
 
+# Shared by the test classes below. Tests should not modify it.
+EXAMPLE_UPLOAD_CONFIGS = BasicUploadJobConfigs(
+    project_name="Behavior Platform",
+    s3_bucket="some_bucket2",
+    platform=Platform.BEHAVIOR,
+    modalities=[
+        ModalityConfigs(
+            modality=Modality.BEHAVIOR_VIDEOS,
+            source="dir/data_set_2",
+        ),
+    ],
+    subject_id="123456",
+    acq_datetime=datetime(2020, 10, 13, 13, 10, 10),
+    metadata_dir="/some/metadata/dir/",
+    force_cloud_sync=False,
+)
+
 
 class TestModalityConfigs(unittest.TestCase):
     """Tests ModalityConfigs class"""
@@ -50,6 +67,8 @@ class TestModalityConfigs(unittest.TestCase):
         """Test parse_modality_string method"""
         configs = ModalityConfigs(modality="ecephys", source="some_dir")
         self.assertEqual(Modality.ECEPHYS, configs.modality)
+        configs = ModalityConfigs(modality="Behavior-Videos", source="dir")
+        self.assertEqual(Modality.BEHAVIOR_VIDEOS, configs.modality)
 
     def test_parse_modality_string_error(self):
         """Test parse_modality_string method raises error"""
@@ -127,7 +146,7 @@ class TestModalityConfigs(unittest.TestCase):
         )
         with self.assertRaises(ValidationError) as e:
             ModalityConfigs.model_validate_json(corrupt_json)
-        errors = json.loads(e.exception.json())
+        errors = e.exception.errors()
         expected_msg = (
             "Value error, output_folder_name incorrect doesn't match ecephys!"
         )
@@ -237,7 +256,7 @@ class TestCodeOceanPipelineMonitorConfigs(unittest.TestCase):
                     tags=tags,
                 ),
             )
-        errors = json.loads(e.exception.json())
+        errors = e.exception.errors()
         self.assertEqual(1, len(errors))
         self.assertEqual(
             "Value error, Tags can only have a max of 10 items!",
@@ -251,32 +270,35 @@ class TestBasicUploadJobConfigs(unittest.TestCase):
     @classmethod
     def setUpClass(cls) -> None:
         """Set up test class"""
-        example_configs = BasicUploadJobConfigs(
-            project_name="Behavior Platform",
-            s3_bucket="some_bucket2",
-            platform=Platform.BEHAVIOR,
-            modalities=[
-                ModalityConfigs(
-                    modality=Modality.BEHAVIOR_VIDEOS,
-                    source=(PurePosixPath("dir") / "data_set_2"),
-                ),
-            ],
-            subject_id="123456",
-            acq_datetime=datetime(2020, 10, 13, 13, 10, 10),
-            metadata_dir="/some/metadata/dir/",
-            force_cloud_sync=False,
-        )
-        cls.example_configs = example_configs
-        cls.base_configs = example_configs.model_dump(
+        cls.example_configs = EXAMPLE_UPLOAD_CONFIGS
+        cls.example_configs_json = EXAMPLE_UPLOAD_CONFIGS.model_dump_json()
+        cls.example_modalities = [
+            m.modality for m in EXAMPLE_UPLOAD_CONFIGS.modalities
+        ]
+        # Dumps that can be passed back into BasicUploadJobConfigs, built
+        # once here rather than in each test
+        job_configs = EXAMPLE_UPLOAD_CONFIGS.model_dump(
             exclude={
-                "s3_bucket": True,
-                "acq_datetime": True,
                 "s3_prefix": True,
                 "modalities": {"__all__": {"output_folder_name"}},
                 "metadata_configs": True,
             }
         )
 
+        def without(*keys: str) -> MappingProxyType:
+            """Read-only view of job_configs with the given keys removed"""
+            return MappingProxyType(
+                {k: v for k, v in job_configs.items() if k not in keys}
+            )
+
+        cls.job_configs = without()
+        cls.base_configs = without("s3_bucket", "acq_datetime")
+        cls.job_configs_no_platform = without("platform")
+        cls.job_configs_no_trigger = without("trigger_capsule_configs")
+        cls.job_configs_no_trigger_or_process_id = without(
+            "trigger_capsule_configs", "process_capsule_id"
+        )
+
     def test_s3_prefix(self):
         """Test s3_prefix property"""
 
@@ -285,10 +307,59 @@ class TestBasicUploadJobConfigs(unittest.TestCase):
             self.example_configs.s3_prefix,
         )
 
+    def test_s3_prefix_updated(self):
+        """Test s3_prefix is rebuilt if one of its inputs is modified"""
+
+        configs = self.example_configs.model_copy()
+        self.assertEqual(
+            "behavior_123456_2020-10-13_13-10-10", configs.s3_prefix
+        )
+        configs.subject_id = "654321"
+        self.assertEqual(
+            "behavior_654321_2020-10-13_13-10-10", configs.s3_prefix
+        )
+        self.assertEqual(
+            "behavior_123456_2020-10-13_13-10-10",
+            self.example_configs.s3_prefix,
+        )
+
+    def test_s3_prefix_equality(self):
+        """Test reading s3_prefix doesn't affect equality"""
+
+        configs1 = self.example_configs.model_copy()
+        configs2 = self.example_configs.model_copy()
+        configs1.subject_id = "654321"
+        self.assertEqual(
+            "behavior_654321_2020-10-13_13-10-10", configs1.s3_prefix
+        )
+        configs1.subject_id = "123456"
+        self.assertEqual(configs2, configs1)
+
+    def test_s3_prefix_timezone(self):
+        """Test s3_prefix uses the local time of acq_datetime"""
+
+        acq_datetime = datetime(2020, 10, 13, 13, 10, 10, tzinfo=timezone.utc)
+        configs1 = self.example_configs.model_copy(
+            update={"acq_datetime": acq_datetime}
+        )
+        configs2 = self.example_configs.model_copy(
+            update={
+                "acq_datetime": acq_datetime.astimezone(
+                    timezone(timedelta(hours=-7))
+                )
+            }
+        )
+        self.assertEqual(
+            "behavior_123456_2020-10-13_13-10-10", configs1.s3_prefix
+        )
+        self.assertEqual(
+            "behavior_123456_2020-10-13_06-10-10", configs2.s3_prefix
+        )
+
     def test_project_names_validation(self):
         """Test project_name is validated against list context provided."""
 
-        model = json.loads(self.example_configs.model_dump_json())
+        model = json.loads(self.example_configs_json)
         with validation_context(
             {"project_names": ["Behavior Platform", "Other Platform"]}
         ):
@@ -303,12 +374,12 @@ class TestBasicUploadJobConfigs(unittest.TestCase):
         """Test project_name is validated against list context provided and
         fails validation."""
 
-        model = json.loads(self.example_configs.model_dump_json())
+        model = json.loads(self.example_configs_json)
         with self.assertRaises(ValidationError) as err:
             with validation_context({"project_names": ["Other Platform"]}):
                 BasicUploadJobConfigs(**model)
 
-        err_msg = json.loads(err.exception.json())[0]["msg"]
+        err_msg = err.exception.errors()[0]["msg"]
         self.assertEqual(
             (
                 "Value error, Behavior Platform must be one of "
@@ -319,37 +390,29 @@ class TestBasicUploadJobConfigs(unittest.TestCase):
 
     def test_map_bucket(self):
         """Test map_bucket method"""
-        open_configs = BasicUploadJobConfigs(
-            s3_bucket="open",
+        for s3_bucket, expected_bucket in [
+            ("open", BucketType.OPEN),
+            ("scratch", BucketType.SCRATCH),
+            ("private", BucketType.PRIVATE),
+            ("custom", BucketType.PRIVATE),
+            (BucketType.PRIVATE, BucketType.PRIVATE),
+        ]:
+            with self.subTest(s3_bucket=s3_bucket):
+                configs = BasicUploadJobConfigs(
+                    s3_bucket=s3_bucket,
+                    acq_datetime=datetime(2020, 10, 13, 13, 10, 10),
+                    **self.base_configs,
+                )
+                self.assertEqual(expected_bucket, configs.s3_bucket)
+
+    def test_map_bucket_default(self):
+        """Test default s3_bucket is validated and stored as a string"""
+        configs = BasicUploadJobConfigs(
             acq_datetime=datetime(2020, 10, 13, 13, 10, 10),
             **self.base_configs,
         )
-        base_configs = open_configs.model_dump(
-            exclude={
-                "s3_bucket": True,
-                "s3_prefix": True,
-                "metadata_configs": True,
-                "modalities": {"__all__": {"output_folder_name"}},
-            }
-        )
-        scratch_configs = BasicUploadJobConfigs(
-            s3_bucket="scratch", **base_configs
-        )
-        private_configs1 = BasicUploadJobConfigs(
-            s3_bucket="private", **base_configs
-        )
-        private_configs2 = BasicUploadJobConfigs(
-            s3_bucket="custom", **base_configs
-        )
-        private_configs3 = BasicUploadJobConfigs(
-            s3_bucket=BucketType.PRIVATE, **base_configs
-        )
-
-        self.assertEqual(BucketType.OPEN, open_configs.s3_bucket)
-        self.assertEqual(BucketType.SCRATCH, scratch_configs.s3_bucket)
-        self.assertEqual(BucketType.PRIVATE, private_configs1.s3_bucket)
-        self.assertEqual(BucketType.PRIVATE, private_configs2.s3_bucket)
-        self.assertEqual(BucketType.PRIVATE, private_configs3.s3_bucket)
+        self.assertEqual("private", configs.model_dump()["s3_bucket"])
+        self.assertIs(str, type(configs.s3_bucket))
 
     def test_parse_datetime(self):
         """Test parse_datetime method"""
@@ -370,43 +433,45 @@ class TestBasicUploadJobConfigs(unittest.TestCase):
     def test_parse_datetime_error(self):
         """Test parse_datetime method raises error"""
 
-        with self.assertRaises(ValidationError) as e:
-            BasicUploadJobConfigs(
-                s3_bucket="open",
-                acq_datetime="2020/05/23T09:05:03",
-                **self.base_configs,
-            )
-        error_msg = json.loads(e.exception.json())[0]["msg"]
-        self.assertTrue("Value error, Incorrect datetime format" in error_msg)
+        for acq_datetime in [
+            "2020/05/23T09:05:03",
+            "2020-23-05T09:05:03",
+            "2020-10-13",
+            "2020-10-13T13:10",
+            "2020-10-13 13:10:10.5",
+            "2020-10-13T13:10:10+05:00",
+            "2020-10-13Z13:10:10",
+            "2020-W42-2T13:10:10",
+            "5/23/2020 9:5:3 AM",
+            "05/23/2020  09:05:03 AM",
+        ]:
+            with self.subTest(acq_datetime=acq_datetime):
+                with self.assertRaises(ValidationError) as e:
+                    BasicUploadJobConfigs(
+                        s3_bucket="open",
+                        acq_datetime=acq_datetime,
+                        **self.base_configs,
+                    )
+                error_msg = e.exception.errors()[0]["msg"]
+                self.assertTrue(
+                    "Value error, Incorrect datetime format" in error_msg
+                )
 
     def test_parse_platform_string(self):
         """Tests platform can be parsed from string"""
 
-        base_configs = self.example_configs.model_dump(
-            exclude={
-                "platform": True,
-                "s3_prefix": True,
-                "metadata_configs": True,
-                "modalities": {"__all__": {"output_folder_name"}},
-            }
+        configs = BasicUploadJobConfigs(
+            platform="behavior", **self.job_configs_no_platform
         )
-        configs = BasicUploadJobConfigs(platform="behavior", **base_configs)
         self.assertEqual(Platform.BEHAVIOR, configs.platform)
 
     def test_parse_platform_string_error(self):
         """Tests that an error is raised if an unknown platform is used"""
 
-        base_configs = self.example_configs.model_dump(
-            exclude={
-                "platform": True,
-                "s3_prefix": True,
-                "metadata_configs": True,
-                "modalities": {"__all__": {"output_folder_name"}},
-            }
-        )
-
         with self.assertRaises(AttributeError) as e:
-            BasicUploadJobConfigs(platform="MISSING", **base_configs)
+            BasicUploadJobConfigs(
+                platform="MISSING", **self.job_configs_no_platform
+            )
         self.assertEqual("Unknown Platform: MISSING", e.exception.args[0])
 
     def test_get_job_type(self):
@@ -447,7 +512,7 @@ class TestBasicUploadJobConfigs(unittest.TestCase):
             asset_name="behavior_123456_2020-10-13_13-10-10",
             mount="behavior_123456_2020-10-13_13-10-10",
             results_suffix="processed",
-            modalities=[m.modality for m in self.example_configs.modalities],
+            modalities=self.example_modalities,
         )
         self.assertEqual(
             expected_configs, self.example_configs.trigger_capsule_configs
@@ -465,16 +530,8 @@ class TestBasicUploadJobConfigs(unittest.TestCase):
             mount="custom_mount",
             results_suffix="custom-suffix",
         )
-        base_configs = self.example_configs.model_dump(
-            exclude={
-                "s3_prefix": True,
-                "modalities": {"__all__": {"output_folder_name"}},
-                "metadata_configs": True,
-                "trigger_capsule_configs": True,
-            }
-        )
         configs = BasicUploadJobConfigs(
-            trigger_capsule_configs=user_configs, **base_configs
+            trigger_capsule_configs=user_configs, **self.job_configs_no_trigger
         )
 
         expected_configs = TriggerConfigModel(
@@ -485,14 +542,29 @@ class TestBasicUploadJobConfigs(unittest.TestCase):
             mount="custom_mount",
             process_capsule_id="abc-123",
             results_suffix="custom-suffix",
-            modalities=[m.modality for m in self.example_configs.modalities],
+            modalities=self.example_modalities,
         )
         self.assertEqual(expected_configs, configs.trigger_capsule_configs)
+        # The user's model is copied rather than modified in place
+        self.assertEqual("should_be_overwritten", user_configs.bucket)
+
+    def test_set_trigger_capsule_configs_user_defined_no_mount(self):
+        """Tests set_trigger_capsule_configs sets the mount when the user
+        defined settings do not have one."""
+        user_configs = TriggerConfigModel(
+            job_type=ValidJobType.RUN_GENERIC_PIPELINE,
+            process_capsule_id="abc-123",
+        )
+        configs = BasicUploadJobConfigs(
+            trigger_capsule_configs=user_configs, **self.job_configs_no_trigger
+        )
+        self.assertEqual(
+            "behavior_123456_2020-10-13_13-10-10",
+            configs.trigger_capsule_configs.mount,
+        )
+        self.assertIsNone(user_configs.mount)
 
-    @patch("logging.warning")
-    def test_set_trigger_capsule_configs_user_defined_error(
-        self, mock_warn: MagicMock
-    ):
+    def test_set_trigger_capsule_configs_user_defined_error(self):
         """Tests set_trigger_capsule_configs values when user defines their
         own settings and an error is raised when user sets both trigger
         configs and process_capsule_id."""
@@ -505,39 +577,29 @@ class TestBasicUploadJobConfigs(unittest.TestCase):
             mount="custom_mount",
             results_suffix="custom-suffix",
         )
-        base_configs = self.example_configs.model_dump(
-            exclude={
-                "s3_prefix": True,
-                "modalities": {"__all__": {"output_folder_name"}},
-                "metadata_configs": True,
-                "trigger_capsule_configs": True,
-                "process_capsule_id": True,
-            }
-        )
-        _ = BasicUploadJobConfigs(
-            trigger_capsule_configs=user_configs,
-            **base_configs,
-            process_capsule_id="def-456",
-        )
-        mock_warn.assert_called_once_with(
-            "Only one of trigger_capsule_configs or legacy "
-            "process_capsule_id should be set!"
+        with self.assertLogs(
+            "aind_data_transfer_models.core", level="WARNING"
+        ) as captured:
+            _ = BasicUploadJobConfigs(
+                trigger_capsule_configs=user_configs,
+                **self.job_configs_no_trigger_or_process_id,
+                process_capsule_id="def-456",
+            )
+        self.assertEqual(
+            [
+                "WARNING:aind_data_transfer_models.core:Only one of "
+                "trigger_capsule_configs or legacy process_capsule_id should "
+                "be set!"
+            ],
+            captured.output,
         )
 
     def test_set_trigger_capsule_configs_user_defined_process_id(self):
         """Tests set_trigger_capsule_configs values when user defines their
         own settings and legacy process capsule id."""
-        base_configs = self.example_configs.model_dump(
-            exclude={
-                "s3_prefix": True,
-                "modalities": {"__all__": {"output_folder_name"}},
-                "metadata_configs": True,
-                "trigger_capsule_configs": True,
-                "process_capsule_id": True,
-            }
-        )
         configs = BasicUploadJobConfigs(
-            **base_configs, process_capsule_id="def-456"
+            **self.job_configs_no_trigger_or_process_id,
+            process_capsule_id="def-456",
         )
         expected_trigger_configs = TriggerConfigModel(
             job_type=ValidJobType.RUN_GENERIC_PIPELINE,
@@ -558,15 +620,8 @@ class TestBasicUploadJobConfigs(unittest.TestCase):
         metadata_configs = GatherMetadataJobSettings(
             directory_to_write_to="/some/path/",
         )
-        base_configs = self.example_configs.model_dump(
-            exclude={
-                "s3_prefix": True,
-                "modalities": {"__all__": {"output_folder_name"}},
-                "metadata_configs": True,
-            }
-        )
         configs = BasicUploadJobConfigs(
-            metadata_configs=metadata_configs, **base_configs
+            metadata_configs=metadata_configs, **self.job_configs
         )
         self.assertEqual(
             configs.metadata_configs.metadata_dir,
@@ -643,8 +698,9 @@ class TestBasicUploadJobConfigs(unittest.TestCase):
 
     def test_round_trip(self):
         """Tests model can be serialized and de-serialized easily"""
-        model_json = self.example_configs.model_dump_json()
-        deserialized = BasicUploadJobConfigs.model_validate_json(model_json)
+        deserialized = BasicUploadJobConfigs.model_validate_json(
+            self.example_configs_json
+        )
         self.assertEqual(self.example_configs, deserialized)
 
     def test_deserialization_fail(self):
@@ -675,7 +731,7 @@ class TestBasicUploadJobConfigs(unittest.TestCase):
         )
         with self.assertRaises(ValidationError) as e:
             BasicUploadJobConfigs.model_validate_json(corrupt_json)
-        errors = json.loads(e.exception.json())
+        errors = e.exception.errors()
         expected_msg = (
             "Value error, s3_prefix incorrect doesn't match computed "
             "behavior_123456_2020-10-13_13-10-10!"
@@ -724,7 +780,7 @@ class TestBasicUploadJobConfigs(unittest.TestCase):
             modalities=[
                 ModalityConfigs(
                     modality=Modality.BEHAVIOR_VIDEOS,
-                    source=(PurePosixPath("dir") / "data_set_2"),
+                    source="dir/data_set_2",
                 ),
             ],
             subject_id="123456",
@@ -774,20 +830,17 @@ class TestSubmitJobRequest(unittest.TestCase):
     def setUpClass(cls) -> None:
         """Set up example configs to be used in tests"""
 
-        example_upload_config = BasicUploadJobConfigs(
-            project_name="Behavior Platform",
-            s3_bucket="some_bucket2",
-            platform=Platform.BEHAVIOR,
-            modalities=[
-                ModalityConfigs(
-                    modality=Modality.BEHAVIOR_VIDEOS,
-                    source=(PurePosixPath("dir") / "data_set_2"),
-                ),
-            ],
-            subject_id="123456",
-            acq_datetime=datetime(2020, 10, 13, 13, 10, 10),
+        cls.example_upload_config = EXAMPLE_UPLOAD_CONFIGS
+        # Read-only dumps that tests unpack to build fresh upload jobs
+        cls.example_upload_config_dump = MappingProxyType(
+            EXAMPLE_UPLOAD_CONFIGS.model_dump(round_trip=True)
+        )
+        cls.example_upload_config_dump_no_email = MappingProxyType(
+            EXAMPLE_UPLOAD_CONFIGS.model_dump(
+                exclude={"user_email", "email_notification_types"},
+                round_trip=True,
+            )
         )
-        cls.example_upload_config = example_upload_config
 
     def test_min_items(self):
         """Tests error is raised if no job list is empty"""
@@ -797,32 +850,30 @@ class TestSubmitJobRequest(unittest.TestCase):
         expected_message = (
             "List should have at least 1 item after validation, not 0"
         )
-        actual_message = json.loads(e.exception.json())[0]["msg"]
-        self.assertEqual(1, len(json.loads(e.exception.json())))
+        errors = e.exception.errors()
+        actual_message = errors[0]["msg"]
+        self.assertEqual(1, len(errors))
         self.assertEqual(expected_message, actual_message)
 
     def test_max_items(self):
         """Tests error is raised if job list is greater than maximum allowed"""
 
-        upload_job = BasicUploadJobConfigs(
-            **self.example_upload_config.model_dump(round_trip=True)
-        )
+        upload_job = BasicUploadJobConfigs(**self.example_upload_config_dump)
 
         with self.assertRaises(ValidationError) as e:
-            SubmitJobRequest(upload_jobs=[upload_job for _ in range(0, 1001)])
+            SubmitJobRequest(upload_jobs=[upload_job] * 1001)
         expected_message = (
             "List should have at most 1000 items after validation, not 1001"
         )
-        actual_message = json.loads(e.exception.json())[0]["msg"]
-        self.assertEqual(1, len(json.loads(e.exception.json())))
+        errors = e.exception.errors()
+        actual_message = errors[0]["msg"]
+        self.assertEqual(1, len(errors))
         self.assertEqual(expected_message, actual_message)
 
     def test_default_settings(self):
         """Tests defaults are set correctly."""
 
-        upload_job = BasicUploadJobConfigs(
-            **self.example_upload_config.model_dump(round_trip=True)
-        )
+        upload_job = BasicUploadJobConfigs(**self.example_upload_config_dump)
 
         job_settings = SubmitJobRequest(upload_jobs=[upload_job])
         self.assertIsNone(job_settings.user_email)
@@ -830,12 +881,15 @@ class TestSubmitJobRequest(unittest.TestCase):
             {EmailNotificationType.FAIL}, job_settings.email_notification_types
         )
         self.assertEqual("transform_and_upload", job_settings.job_type)
+        self.assertIsNone(job_settings.upload_jobs[0].user_email)
+        self.assertEqual(
+            {EmailNotificationType.FAIL},
+            job_settings.upload_jobs[0].email_notification_types,
+        )
 
     def test_non_default_settings(self):
         """Tests user can modify the settings."""
-        upload_job_configs = self.example_upload_config.model_dump(
-            round_trip=True
-        )
+        upload_job_configs = self.example_upload_config_dump
 
         job_settings = SubmitJobRequest(
             user_email="abc@acme.com",
@@ -854,9 +908,7 @@ class TestSubmitJobRequest(unittest.TestCase):
     def test_email_validation(self):
         """Tests user can not input invalid email address."""
 
-        upload_job_configs = self.example_upload_config.model_dump(
-            round_trip=True
-        )
+        upload_job_configs = self.example_upload_config_dump
         with self.assertRaises(ValidationError) as e:
             SubmitJobRequest(
                 user_email="some user",
@@ -865,17 +917,16 @@ class TestSubmitJobRequest(unittest.TestCase):
         # email_validator changed error message across versions. We can just
         # do a quick check that the error message at least contains this part.
         expected_error_message = "value is not a valid email address: "
-        actual_error_message = json.loads(e.exception.json())[0]["msg"]
+        errors = e.exception.errors()
+        actual_error_message = errors[0]["msg"]
         # Check only 1 validation error is raised
-        self.assertEqual(1, len(json.loads(e.exception.json())))
+        self.assertEqual(1, len(errors))
         self.assertIn(expected_error_message, actual_error_message)
 
     def test_propagate_email_settings(self):
         """Tests global email settings is propagated to individual jobs."""
 
-        example_job_configs = self.example_upload_config.model_dump(
-            exclude={"user_email", "email_notification_types"}, round_trip=True
-        )
+        example_job_configs = self.example_upload_config_dump_no_email
         new_job = BasicUploadJobConfigs(
             user_email="xyz@acme.org",
             email_notification_types=[EmailNotificationType.ALL],
@@ -899,6 +950,9 @@ class TestSubmitJobRequest(unittest.TestCase):
         self.assertEqual(
             "abc@acme.org", job_settings.upload_jobs[1].user_email
         )
+        self.assertIn(
+            "user_email", job_settings.upload_jobs[1].model_fields_set
+        )
         self.assertEqual(
             {"all"}, job_settings.upload_jobs[0].email_notification_types
         )
@@ -907,6 +961,64 @@ class TestSubmitJobRequest(unittest.TestCase):
             job_settings.upload_jobs[1].email_notification_types,
         )
 
+    def test_propagate_email_settings_reused_job(self):
+        """Tests global email settings don't modify a job reused across
+        requests."""
+
+        upload_job = BasicUploadJobConfigs(
+            **self.example_upload_config_dump_no_email
+        )
+        job_settings1 = SubmitJobRequest(
+            user_email="abc@acme.org", upload_jobs=[upload_job]
+        )
+        job_settings2 = SubmitJobRequest(
+            user_email="xyz@acme.org", upload_jobs=[upload_job]
+        )
+
+        self.assertEqual(
+            "abc@acme.org", job_settings1.upload_jobs[0].user_email
+        )
+        self.assertEqual(
+            "xyz@acme.org", job_settings2.upload_jobs[0].user_email
+        )
+        self.assertIsNone(upload_job.user_email)
+        self.assertIsNone(upload_job.email_notification_types)
+        self.assertNotIn("user_email", upload_job.model_fields_set)
+
+    def test_modified_job_revalidated(self):
+        """Tests a job modified after construction is validated again when
+        passed into a request."""
+
+        upload_job = BasicUploadJobConfigs(
+            **self.example_upload_config_dump_no_email
+        )
+        upload_job.subject_id = "999"
+        upload_job.s3_bucket = "some-open-bucket"
+        job_settings = SubmitJobRequest(upload_jobs=[upload_job])
+        job = job_settings.upload_jobs[0]
+
+        self.assertEqual("open", job.s3_bucket)
+        self.assertEqual(
+            "999", job.metadata_configs.subject_settings.subject_id
+        )
+        self.assertEqual(
+            job.s3_prefix,
+            job.metadata_configs.raw_data_description_settings.name,
+        )
+        self.assertEqual(job.s3_prefix, job.trigger_capsule_configs.prefix)
+
+    def test_modified_job_invalid(self):
+        """Tests a job modified into an invalid state is rejected when passed
+        into a request."""
+
+        upload_job = BasicUploadJobConfigs(
+            **self.example_upload_config_dump_no_email
+        )
+        upload_job.modalities = []
+        with self.assertRaises(ValidationError) as e:
+            SubmitJobRequest(upload_jobs=[upload_job])
+        self.assertEqual("too_short", e.exception.errors()[0]["type"])
+
     def test_institution_setting(self):
         """Tests that users can set the institution in the metadata configs."""
         metadata_configs = {
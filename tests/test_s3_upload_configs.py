@@ -1,7 +1,8 @@
 """Tests for s3_upload_configs module"""
 
 import unittest
-from pathlib import PurePosixPath
+
+from pydantic import ValidationError
 
 from aind_data_transfer_models.s3_upload_configs import (
     S3UploadJobConfigs,
@@ -18,13 +19,27 @@ class TestS3UploadJobConfigs(unittest.TestCase):
             s3_bucket="scratch",
             s3_prefix="anna.apple/data_set_2",
             user_email="anna.apple@acme.co",
-            input_source=(PurePosixPath("dir") / "data_set_2"),
+            input_source="dir/data_set_2",
             force_cloud_sync=False,
         )
         self.assertEqual(
             "anna.apple/data_set_2", example_scratch_configs.s3_prefix
         )
 
+    def test_extra_forbid(self):
+        """Tests that unknown fields are rejected"""
+        with self.assertRaises(ValidationError) as e:
+            S3UploadJobConfigs(
+                s3_bucket="scratch",
+                s3_prefix="anna.apple/data_set_2",
+                input_source="dir/data_set_2",
+                typo=1,
+            )
+        errors = e.exception.errors()
+        self.assertEqual(1, len(errors))
+        self.assertEqual("extra_forbidden", errors[0]["type"])
+        self.assertEqual(("typo",), errors[0]["loc"])
+
 
 class TestS3UploadSubmitJobRequest(unittest.TestCase):
     """Tests S3UploadSubmitJobRequest class"""
@@ -36,14 +51,14 @@ class TestS3UploadSubmitJobRequest(unittest.TestCase):
             s3_bucket="scratch",
             s3_prefix="anna.apple/data_set_2",
             user_email="anna.apple@acme.co",
-            input_source=(PurePosixPath("dir") / "data_set_2"),
+            input_source="dir/data_set_2",
             force_cloud_sync=False,
         )
         example_archive_configs = S3UploadJobConfigs(
             s3_bucket="archive",
             s3_prefix="ephys_project/data_set_2",
             user_email="anna.apple@acme.co",
-            input_source=(PurePosixPath("dir") / "data_set_2"),
+            input_source="dir/data_set_2",
             force_cloud_sync=False,
         )
         cls.example_scratch_configs = example_scratch_configs
@@ -60,6 +75,53 @@ class TestS3UploadSubmitJobRequest(unittest.TestCase):
         self.assertEqual("s3_upload", submit_job_request.job_type)
         self.assertIsNotNone(submit_job_request)
 
+    def test_propagate_email_settings_reused_job(self):
+        """Tests global email settings don't modify a job reused across
+        requests"""
+        upload_job = S3UploadJobConfigs(
+            s3_bucket="scratch",
+            s3_prefix="anna.apple/data_set_2",
+            input_source="dir/data_set_2",
+        )
+        submit_job_request1 = S3UploadSubmitJobRequest(
+            user_email="anna.apple@acme.co", upload_jobs=[upload_job]
+        )
+        submit_job_request2 = S3UploadSubmitJobRequest(
+            user_email="bob.apple@acme.co", upload_jobs=[upload_job]
+        )
+        self.assertEqual(
+            "anna.apple@acme.co",
+            submit_job_request1.upload_jobs[0].user_email,
+        )
+        self.assertEqual(
+            "bob.apple@acme.co", submit_job_request2.upload_jobs[0].user_email
+        )
+        self.assertIn(
+            "user_email", submit_job_request2.upload_jobs[0].model_fields_set
+        )
+        self.assertIsNone(upload_job.user_email)
+        self.assertIsNone(upload_job.email_notification_types)
+
+    def test_upload_jobs_not_list(self):
+        """Tests that upload_jobs that isn't a list is rejected"""
+        with self.assertRaises(ValidationError) as e:
+            S3UploadSubmitJobRequest(upload_jobs=None)
+        errors = e.exception.errors()
+        self.assertEqual(1, len(errors))
+        self.assertEqual("list_type", errors[0]["type"])
+
+    def test_extra_forbid(self):
+        """Tests that unknown fields are rejected"""
+        with self.assertRaises(ValidationError) as e:
+            S3UploadSubmitJobRequest(
+                upload_jobs=[self.example_scratch_configs],
+                user_emial="anna.apple@acme.co",
+            )
+        errors = e.exception.errors()
+        self.assertEqual(1, len(errors))
+        self.assertEqual("extra_forbidden", errors[0]["type"])
+        self.assertEqual(("user_emial",), errors[0]["loc"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -59,31 +59,41 @@ class TestTriggerConfigModel(unittest.TestCase):
         self.assertEqual(config.input_data_asset_id, ["0000", "0001"])
         self.assertEqual(config.input_data_mount, ["mount1", "mount2"])
 
-        # passing multiple assets with only no mount points
-        with self.assertRaises(ValueError):
-            _ = TriggerConfigModel(
-                job_type="ecephys",
-                input_data_asset_id="0000;0001",
-                input_data_mount=None,
-                input_data_asset_name="ecephys_session",
-            )
-
-        # passing multiple assets with only no input_data_asset_name
-        with self.assertRaises(ValueError):
-            _ = TriggerConfigModel(
-                job_type="ecephys",
-                input_data_asset_id="0000;0001",
-                input_data_mount="mount1;mount2",
-            )
-
-        # passing multiple assets with unmatched mount points
-        with self.assertRaises(ValueError):
-            _ = TriggerConfigModel(
-                job_type="ecephys",
-                input_data_asset_id="0000;0001",
-                input_data_mount="mount1;mount2;mount3",
-                input_data_asset_name="ecephys_session",
-            )
+        for invalid_configs in [
+            # passing multiple assets with only no mount points
+            {
+                "input_data_mount": None,
+                "input_data_asset_name": "ecephys_session",
+            },
+            # passing multiple assets with only no input_data_asset_name
+            {"input_data_mount": "mount1;mount2"},
+            # passing multiple assets with unmatched mount points
+            {
+                "input_data_mount": "mount1;mount2;mount3",
+                "input_data_asset_name": "ecephys_session",
+            },
+        ]:
+            with self.subTest(**invalid_configs):
+                with self.assertRaises(ValueError):
+                    _ = TriggerConfigModel(
+                        job_type="ecephys",
+                        input_data_asset_id="0000;0001",
+                        **invalid_configs,
+                    )
+
+    def test_input_data_fields_unset(self):
+        """Test input data fields stay unset unless they are split"""
+        config = TriggerConfigModel(job_type="ecephys")
+        self.assertNotIn("input_data_asset_id", config.model_fields_set)
+        self.assertNotIn("input_data_mount", config.model_fields_set)
+        config = TriggerConfigModel(
+            job_type="ecephys",
+            input_data_asset_id="0000;0001",
+            input_data_mount="mount1;mount2",
+            input_data_asset_name="ecephys_session",
+        )
+        self.assertIn("input_data_asset_id", config.model_fields_set)
+        self.assertIn("input_data_mount", config.model_fields_set)
 
     def test_modalities_parsing(self):
         """Test modalities field"""